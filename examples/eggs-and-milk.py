@@ -2,16 +2,18 @@ from __future__ import annotations
 
 import pathlib
 import os
+from math import nan
 
 import AppKit
 
 from twisted.internet.interfaces import IReactorTime
-from twisted.internet.defer import Deferred
-from twisted.python.failure import Failure
 
 from quickmacapp import mainpoint, Status, ask, choose, answer, quit
 
-resultTemplate = """
+def formatResult(
+    eggDays: float, milkDays: float, eggPrice: float, milkPrice: float
+) -> str:
+    return f"""
 You need to go to the store to get more eggs in {eggDays} days
 You need to go to the store to get more milk in {milkDays} days
 You will need to bring around ${eggPrice} to get the same amount of eggs
@@ -25,10 +27,12 @@ milkOuncePrice = 0.05
 
 
 def alwaysFloat(value: str | None) -> float:
+    if not value:
+        return nan
     try:
-        return float(value or "nan")
-    except:
-        return float("nan")
+        return float(value)
+    except ValueError:
+        return nan
 
 
 async def eggsAndMilkMinder() -> None:
@@ -39,7 +43,7 @@ async def eggsAndMilkMinder() -> None:
         await ask("Enter in the amount of milk you drink each day in ounces")
     )
     await answer(
-        resultTemplate.format(
+        formatResult(
             eggDays=(eggCount / eatEggCount),
             milkDays=(milkCount / drinkMilkCount),
             eggPrice=eggCount * eggUnitPrice,
@@ -63,28 +67,24 @@ async def eggsAndMilkMinder() -> None:
     )
 
 
+async def about() -> None:
+    await answer(
+        "Eggs And Milk Minder 1.0c",
+        "With apologies to Roast Beef Kazenzakis",
+    )
+
+
 @mainpoint()
 def app(reactor: IReactorTime) -> None:
     app = AppKit.NSApplication.sharedApplication()
     app.setActivationPolicy_(AppKit.NSApplicationActivationPolicyAccessory)
     status = Status("🥚🥛")
     status.menu(
-        [
-            (
-                "About",
-                lambda: Deferred.fromCoroutine(
-                    answer(
-                        "Eggs And Milk Minder 1.0c",
-                        "With apologies to Roast Beef Kazenzakis",
-                    )
-                ),
-            ),
-            (
-                "Calculate Eggs And Milk",
-                lambda: Deferred.fromCoroutine(eggsAndMilkMinder()),
-            ),
+        (
+            ("About", about),
+            ("Calculate Eggs And Milk", eggsAndMilkMinder),
             ("Quit", quit),
-        ]
+        )
     )
 
 
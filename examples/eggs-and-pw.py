@@ -6,8 +6,6 @@ import os
 import AppKit
 
 from twisted.internet.interfaces import IReactorTime
-from twisted.internet.defer import Deferred
-from twisted.python.failure import Failure
 
 from quickmacapp import mainpoint, Status, answer, quit, getpass
 
@@ -16,27 +14,23 @@ async def eggsPassword() -> None:
     await answer (f"I tricked you, your password is {pw}")
 
 
+async def about() -> None:
+    await answer(
+        "Secure Your Eggs In One Basket",
+    )
+
+
 @mainpoint()
 def app(reactor: IReactorTime) -> None:
     app = AppKit.NSApplication.sharedApplication()
     app.setActivationPolicy_(AppKit.NSApplicationActivationPolicyAccessory)
     status = Status("🥚🔒")
     status.menu(
-        [
-            (
-                "About",
-                lambda: Deferred.fromCoroutine(
-                    answer(
-                        "Secure Your Eggs In One Basket",
-                    )
-                ),
-            ),
-            (
-                "Enter Password for Eggs",
-                lambda: Deferred.fromCoroutine(eggsPassword()).addErrback(lambda f: f.printTraceback()),
-            ),
+        (
+            ("About", about),
+            ("Enter Password for Eggs", eggsPassword),
             ("Quit", quit),
-        ]
+        )
     )
 
 
@@ -18,7 +18,7 @@ def app(reactor: IReactorTime) -> None:
         print("Sun destruction capabalities still not deployed")
 
     status = Status("☀️ 💣")
-    status.menu([("Check sun", check_sun), ("Destroy sun", destroy_sun)])
+    status.menu((("Check sun", check_sun), ("Destroy sun", destroy_sun)))
 
     nib_file = pathlib.Path(__file__).parent / "MainMenu.nib"
     nib_data = AppKit.NSData.dataWithContentsOfFile_(os.fspath(nib_file))
@@ -1,57 +1,93 @@
-from typing import Iterable, Iterator, TypeVar
+from collections import deque
+from functools import cache
+from typing import Iterable, TypeVar
 
 from AppKit import (
     NSAlertFirstButtonReturn,
     NSAlertSecondButtonReturn,
     NSAlertThirdButtonReturn,
     NSAlert,
-    NSApp,
+    NSApplication,
     NSTextField,
     NSSecureTextField,
     NSCenterTextAlignment,
 )
 from Foundation import (
-    NSRunLoop,
+    NSOperationQueue,
     NSRect,
 )
 from twisted.internet.defer import Deferred
+from twisted.python.failure import Failure
 
 
 NSModalResponse = int
 T = TypeVar("T")
 
+_DEFAULT_TXT_RECT = NSRect((0, 0), (200, 100))
 
-def asyncModal(alert: NSAlert) -> Deferred[NSModalResponse]:
+# sample value used to give the password field a reasonable visual width
+_GETPASS_SAMPLE = "testing " * 4
+
+# NSAlert's return values are consecutive integers starting at the first
+# button, so button N maps to NSAlertFirstButtonReturn + N.
+assert NSAlertSecondButtonReturn == NSAlertFirstButtonReturn + 1
+assert NSAlertThirdButtonReturn == NSAlertSecondButtonReturn + 1
+
+
+@cache
+def _app() -> NSApplication:
     """
-    Run an NSAlert asynchronously.
+    Look up the shared application object once; it never changes after launch.
     """
-    d: Deferred[NSModalResponse] = Deferred()
+    return NSApplication.sharedApplication()
+
+
+@cache
+def _mainQueue() -> NSOperationQueue:
+    """
+    Look up the main operation queue once; like the shared application, it is
+    a process-lifetime singleton.
+    """
+    return NSOperationQueue.mainQueue()
+
+
+_pendingAlerts: deque[tuple[NSAlert, Deferred[NSModalResponse]]] = deque()
+
 
-    def runAndReport() -> None:
+def _drainAlerts() -> None:
+    """
+    Present every queued alert in sequence, firing each one's L{Deferred} as
+    its modal session ends.
+    """
+    while _pendingAlerts:
+        alert, d = _pendingAlerts.popleft()
         try:
-            NSApp().activateIgnoringOtherApps_(True)
+            _app().activateIgnoringOtherApps_(True)
             result = alert.runModal()
-        except:
-            d.errback()
+        except Exception:
+            d.errback(Failure())
         else:
             d.callback(result)
 
-    NSRunLoop.currentRunLoop().performBlock_(runAndReport)
-    return d
-
 
-def _alertReturns() -> Iterator[NSModalResponse]:
+def asyncModal(alert: NSAlert) -> Deferred[NSModalResponse]:
     """
-    Enumerate the values used by NSAlert for return values in the order of the
-    buttons that occur.
+    Run an NSAlert asynchronously.
+
+    Consecutive calls within one run-loop iteration are coalesced into a
+    single block that presents the queued alerts back to back, rather than
+    scheduling one run-loop wakeup apiece.
+
+    The block is enqueued on the main operation queue, so it runs after the
+    current run-loop callout drains rather than re-entering it, and the
+    L{Deferred} always fires on the main thread where the reactor lives.
     """
-    yield NSAlertFirstButtonReturn
-    yield NSAlertSecondButtonReturn
-    yield NSAlertThirdButtonReturn
-    i = 1
-    while True:
-        yield NSAlertThirdButtonReturn + i
-        i += 1
+    d: Deferred[NSModalResponse] = Deferred()
+    wasEmpty = not _pendingAlerts
+    _pendingAlerts.append((alert, d))
+    if wasEmpty:
+        _mainQueue().addOperationWithBlock_(_drainAlerts)
+    return d
 
 
 async def choose(values: Iterable[tuple[T, str]], question: str, description: str="") -> T:
@@ -62,17 +98,17 @@ async def choose(values: Iterable[tuple[T, str]], question: str, description: st
     msg = NSAlert.alloc().init()
     msg.setMessageText_(question)
     msg.setInformativeText_(description)
-    potentialResults = {}
-    for (value, label), alertReturn in zip(values, _alertReturns()):
+    orderedValues: list[T] = []
+    for (value, label) in values:
         msg.addButtonWithTitle_(label)
-        potentialResults[alertReturn] = value
-    msg.layout()
-    return potentialResults[await asyncModal(msg)]
+        orderedValues.append(value)
+    index: int = await asyncModal(msg) - NSAlertFirstButtonReturn
+    return orderedValues[index]
 
 
 async def getpass(question: str, description: str="") -> str | None:
     # set a sample value to get a reasonable visual width
-    txt = NSSecureTextField.textFieldWithString_("testing " * 4)
+    txt = NSSecureTextField.textFieldWithString_(_GETPASS_SAMPLE)
     # clear it out because of course we don't want to use that value
     txt.setStringValue_("")
     txt.setAlignment_(NSCenterTextAlignment)
@@ -82,7 +118,7 @@ async def getpass(question: str, description: str="") -> str | None:
 
 async def ask(question: str, description: str="", defaultValue: str=""):
     # TODO: version of this with a NSSecureTextField for entering passwords
-    txt = NSTextField.alloc().initWithFrame_(NSRect((0, 0), (200, 100)))
+    txt = NSTextField.alloc().initWithFrame_(_DEFAULT_TXT_RECT)
     txt.setMaximumNumberOfLines_(5)
     txt.setStringValue_(defaultValue)
     return await _ask(question, description, txt)
@@ -91,6 +127,11 @@ async def ask(question: str, description: str="", defaultValue: str=""):
 async def _ask(question: str, description: str, txt: NSTextField) -> str | None:
     """
     Prompt the user for a short string of text.
+
+    Each prompt gets its own NSAlert: prompts can overlap (several may be
+    queued within one run-loop iteration, and timers firing inside a nested
+    modal session can issue new ones), so a shared alert would be reconfigured
+    out from under whichever caller hasn't been presented yet.
     """
     msg = NSAlert.alloc().init()
     msg.addButtonWithTitle_("OK")
@@ -100,7 +141,6 @@ async def _ask(question: str, description: str, txt: NSTextField) -> str | None:
 
     msg.setAccessoryView_(txt)
     msg.window().setInitialFirstResponder_(txt)
-    msg.layout()
 
     response: NSModalResponse = await asyncModal(msg)
 
@@ -114,11 +154,13 @@ async def _ask(question: str, description: str, txt: NSTextField) -> str | None:
 async def answer(message: str, description: str="") -> None:
     """
     Give the user a message.
+
+    As with L{_ask}, each message gets its own NSAlert; a burst of answer()
+    calls is queued and presented back to back, and a shared alert would show
+    only the last caller's text for every one of them.
     """
     msg = NSAlert.alloc().init()
     msg.setMessageText_(message)
     msg.setInformativeText_(description)
-    # msg.addButtonWithTitle("OK")
-    msg.layout()
 
     await asyncModal(msg)
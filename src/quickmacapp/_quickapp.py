@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
+import io
 import os
 import sys
 import traceback
-from typing import Callable, Protocol, Any
-
-from objc import ivar, IBAction, super
+from functools import cache, partial
+from inspect import iscoroutinefunction
+from typing import Callable, Iterable, Protocol, Any
+
+from twisted.internet import cfreactor
+from twisted.internet.defer import Deferred
+
+from objc import (
+    ivar,
+    IBAction,
+    super,
+    getAssociatedObject,
+    setAssociatedObject,
+    OBJC_ASSOCIATION_RETAIN,
+)
 
 from Foundation import (
     NSObject,
@@ -23,6 +38,7 @@ from AppKit import (
     NSVariableStatusItemLength,
 )
 
+from PyObjCTools import AppHelper, Debugging
 from PyObjCTools.Debugging import _run_atos, isPythonException
 from ExceptionHandling import (  # type:ignore
     NSStackTraceKey,
@@ -34,9 +50,9 @@ class Actionable(NSObject):
     Wrap a Python no-argument function call in an NSObject with a C{doIt:}
     method.
     """
-    _thunk: Callable[[], None]
+    _thunk: Callable[[], object]
 
-    def initWithFunction_(self, thunk: Callable[[], None]) -> Actionable:
+    def initWithFunction_(self, thunk: Callable[[], object]) -> Actionable:
         """
         Remember the given callable.
 
@@ -54,26 +70,102 @@ class Actionable(NSObject):
         self._thunk()
 
 
-def menu(title: str, items: list[tuple[str, Callable[[], object]]]) -> NSMenu:
+def _asThunk(thunk: Callable[[], object]) -> Callable[[], object]:
+    """
+    Convert a menu action into a plain no-argument callable; coroutine
+    functions are wrapped so that clicking the item schedules the coroutine
+    with L{Deferred.fromCoroutine}.
+    """
+    if iscoroutinefunction(thunk):
+        def runCoroutine() -> None:
+            Deferred.fromCoroutine(thunk())
+        return runCoroutine
+    return thunk
+
+
+# Pre-resolved alloc bindings: PyObjC method access walks the class's method
+# list on each lookup, and menu() performs two of them per item.
+_allocMenuItem = NSMenuItem.alloc
+_allocActionable = Actionable.alloc
+
+# The selector string every menu item shares; hoisted so each item hands
+# PyObjC the same cached object rather than a fresh literal to convert.
+_DO_IT = "doIt:"
+
+# Lowercased, interned single-character strings for the ASCII range, so
+# computing a key equivalent doesn't consult the Unicode database or allocate
+# for the common case of an ASCII title.
+_KEY_EQUIVALENTS = tuple(
+    sys.intern(chr(c | 0x20) if 0x41 <= c <= 0x5A else chr(c)) for c in range(128)
+)
+
+
+def _keyEquivalent(subtitle: str) -> str:
+    """
+    Compute a menu item's key equivalent: its first character, lowercased.
+    """
+    first = subtitle[0]
+    point = ord(first)
+    return _KEY_EQUIVALENTS[point] if point < 128 else first.lower()
+
+
+# Key under which a menu's list of owned Actionable targets is associated
+# with the NSMenu itself, scoping their lifetime to the menu's.
+_OWNED_ACTIONABLES = object()
+
+
+def _ownersOf(nsmenu: NSMenu) -> list[Actionable]:
+    """
+    Get (creating if necessary) the list of L{Actionable} objects owned by
+    the given menu, kept alive exactly as long as the menu is.
+    """
+    owners: list[Actionable] | None = getAssociatedObject(nsmenu, _OWNED_ACTIONABLES)
+    if owners is None:
+        owners = []
+        setAssociatedObject(nsmenu, _OWNED_ACTIONABLES, owners, OBJC_ASSOCIATION_RETAIN)
+    return owners
+
+
+def _menuItem(subtitle: str, thunk: Callable[[], object]) -> tuple[NSMenuItem, Actionable]:
+    """
+    Build an NSMenuItem targeting an L{Actionable} for the given thunk.
+
+    @note: Since NSMenuItem's target attribute is a weak reference, the
+        caller must keep the returned L{Actionable} alive, normally by adding
+        it to the owning menu's L{_ownersOf} list.
+    """
+    item = _allocMenuItem().initWithTitle_action_keyEquivalent_(
+        subtitle, _DO_IT, _keyEquivalent(subtitle)
+    )
+    actionable = _allocActionable().initWithFunction_(_asThunk(thunk))
+    item.setTarget_(actionable)
+    return item, actionable
+
+
+def menu(title: str, items: Iterable[tuple[str, Callable[[], object]]]) -> NSMenu:
     """
     Construct an NSMenu from a list of tuples describing it.
 
-    @note: Since NSMenu's target attribute is a weak reference, the callable
-        objects here are made immortal via an unpaired call to C{retain} on
-        their L{Actionable} wrappers.
+    @note: Since NSMenu's target attribute is a weak reference, the
+        L{Actionable} wrappers are owned by an object association on the menu
+        itself, so they live exactly as long as it does.
 
-    @param items: list of pairs of (menu item's name, click action).
+    @param items: iterable of pairs of (menu item's name, click action).  The
+        action may be a plain callable or an C{async def} coroutine function;
+        the latter is scheduled on the reactor when clicked.
 
     @return: a new Menu tha is not attached to anything.
     """
     result = NSMenu.alloc().initWithTitle_(title)
+    # Actionable items are always enabled; opting out of auto-enablement
+    # skips AppKit's per-item validation walk every time the menu is shown.
+    result.setAutoenablesItems_(False)
+    owners = _ownersOf(result)
+    addItem = result.addItem_
     for (subtitle, thunk) in items:
-        item = NSMenuItem.alloc().initWithTitle_action_keyEquivalent_(
-            subtitle, "doIt:", subtitle[0].lower()
-        )
-        item.setTarget_(Actionable.alloc().initWithFunction_(thunk).retain())
-        result.addItem_(item)
-    result.update()
+        item, actionable = _menuItem(subtitle, thunk)
+        owners.append(actionable)
+        addItem(item)
     return result
 
 
@@ -95,15 +187,54 @@ class Status:
         self.item.setEnabled_(True)
         self.item.setHighlightMode_(True)
 
-    def menu(self, items: list[tuple[str, Callable[[], object]]]) -> None:
+    def menu(self, items: Iterable[tuple[str, Callable[[], object]]]) -> None:
         """
         Set the status drop-down menu.
 
-        @param items: list of pairs of (menu item's name, click action).
+        When called repeatedly, the NSMenuItem at each position is reused
+        (its title, key equivalent, and action updated in place) rather than
+        rebuilding the whole menu; surplus trailing items are removed and
+        their L{Actionable} wrappers dropped from the menu's ownership list
+        so repeated calls don't leak.  Keying on position rather than title
+        keeps the result independent of call history, even with duplicate
+        titles.
+
+        @param items: iterable of pairs of (menu item's name, click action).
 
         @see: L{menu}
         """
-        self.item.setMenu_(menu(self.item.title(), items))
+        existing = self.item.menu()
+        if existing is None:
+            self.item.setMenu_(menu(self.item.title(), items))
+            return
+        owners = _ownersOf(existing)
+        desired = list(items)
+        while existing.numberOfItems() > len(desired):
+            menuItem = existing.itemAtIndex_(existing.numberOfItems() - 1)
+            target = menuItem.target()
+            existing.removeItem_(menuItem)
+            if target is not None and target in owners:
+                owners.remove(target)
+        for index, (subtitle, thunk) in enumerate(desired):
+            menuItem = (
+                existing.itemAtIndex_(index)
+                if index < existing.numberOfItems()
+                else None
+            )
+            target = menuItem.target() if menuItem is not None else None
+            if menuItem is not None and isinstance(target, Actionable):
+                if menuItem.title() != subtitle:
+                    menuItem.setTitle_(subtitle)
+                    menuItem.setKeyEquivalent_(_keyEquivalent(subtitle))
+                target._thunk = _asThunk(thunk)
+            else:
+                # either we're past the end of the existing menu, or this
+                # item wasn't built by this module; replace it wholesale
+                newItem, actionable = _menuItem(subtitle, thunk)
+                owners.append(actionable)
+                if menuItem is not None:
+                    existing.removeItem_(menuItem)
+                existing.insertItem_atIndex_(newItem, index)
 
 
 def fmtPythonException(exception: NSException) -> str:
@@ -111,13 +242,73 @@ def fmtPythonException(exception: NSException) -> str:
     Format an NSException containing a wrapped PyObjC python exception.
     """
     userInfo = exception.userInfo()
-    return "*** Python exception discarded!\n" + "".join(
-        traceback.format_exception(
+    buf = io.StringIO()
+    buf.write("*** Python exception discarded!\n")
+    buf.writelines(
+        traceback.TracebackException(
             userInfo["__pyobjc_exc_type__"],
             userInfo["__pyobjc_exc_value__"],
             userInfo["__pyobjc_exc_traceback__"],
-        )
+        ).format()
     )
+    return buf.getvalue()
+
+
+class _DlInfo(ctypes.Structure):
+    """
+    The C{Dl_info} struct filled in by C{dladdr(3)}.
+    """
+    _fields_ = [
+        ("dli_fname", ctypes.c_char_p),
+        ("dli_fbase", ctypes.c_void_p),
+        ("dli_sname", ctypes.c_char_p),
+        ("dli_saddr", ctypes.c_void_p),
+    ]
+
+
+@cache
+def _dladdr() -> Any:
+    """
+    Load C{dladdr} out of libSystem once, or L{None} if that fails for any
+    reason.
+    """
+    try:
+        libSystem = ctypes.CDLL(ctypes.util.find_library("System"))
+        dladdr = libSystem.dladdr
+    except (OSError, TypeError, AttributeError):
+        return None
+    dladdr.argtypes = [ctypes.c_void_p, ctypes.POINTER(_DlInfo)]
+    dladdr.restype = ctypes.c_int
+    return dladdr
+
+
+def _symbolicate(stack: Iterable[int]) -> list[str] | None:
+    """
+    Symbolicate the given return addresses in-process with C{dladdr}, rather
+    than paying a fork/exec of C{atos} per reported exception.
+
+    @return: one formatted line per address, or L{None} if C{dladdr} is
+        unavailable and the caller should fall back to C{atos}.
+    """
+    dladdr = _dladdr()
+    if dladdr is None:
+        return None
+    info = _DlInfo()
+    lines = []
+    for address in stack:
+        if dladdr(address, ctypes.byref(info)) and info.dli_sname:
+            image = (
+                os.path.basename(info.dli_fname.decode("utf-8", "replace"))
+                if info.dli_fname
+                else "???"
+            )
+            lines.append(
+                "%s (in %s) + %d"
+                % (info.dli_sname.decode(), image, address - info.dli_saddr)
+            )
+        else:
+            lines.append(hex(address))
+    return lines
 
 
 def fmtObjCException(exception: NSException) -> str:
@@ -137,13 +328,16 @@ def fmtObjCException(exception: NSException) -> str:
     if stacktrace is None:
         stack = exception.callStackReturnAddresses()
         if stack:
-            pipe = _run_atos(" ".join(hex(v) for v in stack))
-            if pipe is None:
-                return "ObjC exception reporting error: cannot run atos"
+            stacktrace = _symbolicate(stack)
+            if stacktrace is not None:
+                stacktrace.reverse()
+            else:
+                pipe = _run_atos(" ".join(map(hex, stack)))
+                if pipe is None:
+                    return "ObjC exception reporting error: cannot run atos"
 
-            stacktrace = pipe.readlines()
-            stacktrace.reverse()
-            pipe.close()
+                stacktrace = pipe.read().splitlines()[::-1]
+                pipe.close()
 
     if stacktrace is None:
         userInfo = exception.userInfo()
@@ -155,8 +349,7 @@ def fmtObjCException(exception: NSException) -> str:
         if pipe is None:
             return "ObjC exception reporting error: cannot run atos"
 
-        stacktrace = pipe.readlines()
-        stacktrace.reverse()
+        stacktrace = pipe.read().splitlines()[::-1]
         pipe.close()
 
     return (
@@ -183,9 +376,10 @@ class QuickApplication(NSApplication):
         """
         Hand off any incoming events to the key equivalent handler.
         """
-        if self.keyEquivalentHandler is not None:
-            if self.keyEquivalentHandler.performKeyEquivalent_(event):
-                return
+        # called for every event the app sees; read the ivar exactly once
+        handler = self.keyEquivalentHandler
+        if handler is not None and handler.performKeyEquivalent_(event):
+            return
         super().sendEvent_(event)
 
     def reportException_(self, exception):
@@ -212,6 +406,16 @@ class MainRunner(Protocol):
 
     runMain: Callable[[], None]
 
+
+def _verboseRunner() -> None:
+    """
+    Run the AppKit event loop with PyObjC's verbose exception handler
+    installed.
+    """
+    Debugging.installVerboseExceptionHandler()
+    AppHelper.runEventLoop()
+
+
 def mainpoint() -> Callable[[Callable[[Any], None]], MainRunner]:
     """
     Add a .runMain attribute to function
@@ -223,20 +427,9 @@ def mainpoint() -> Callable[[Callable[[Any], None]], MainRunner]:
     """
     def wrapup(appmain: Callable[[Any], None]) -> MainRunner:
         def doIt() -> None:
-            from twisted.internet import cfreactor
-            import PyObjCTools.AppHelper
-
             QuickApplication.sharedApplication()
-
-            def myRunner() -> None:
-                PyObjCTools.Debugging.installVerboseExceptionHandler()
-                PyObjCTools.AppHelper.runEventLoop()
-
-            def myMain() -> None:
-                appmain(reactor)
-
-            reactor = cfreactor.install(runner=myRunner)
-            reactor.callWhenRunning(myMain)
+            reactor = cfreactor.install(runner=_verboseRunner)
+            reactor.callWhenRunning(partial(appmain, reactor))
             reactor.run()
             os._exit(0)
 